@@ -0,0 +1,113 @@
+"""
+Redis Cache Helpers
+
+Read-through caching for hot, read-mostly endpoints. The client is optional:
+when REDIS_URL is not set every helper becomes a no-op and handlers fall
+through to MongoDB, mirroring how database.py handles a missing DATABASE_URL.
+"""
+
+import functools
+import json
+import os
+from datetime import datetime
+
+import redis.asyncio as aioredis
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+redis_client = None
+
+redis_url = os.getenv("REDIS_URL")
+
+if redis_url:
+    redis_client = aioredis.from_url(redis_url, decode_responses=True)
+
+CACHE_PREFIX = "cache:v1"
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def cache_key(namespace: str, *parts) -> str:
+    return ":".join([CACHE_PREFIX, namespace, *[str(p) for p in parts]])
+
+
+def cache(namespace: str, ttl: int):
+    """Read-through cache decorator keyed by endpoint namespace + call args."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            if redis_client is None:
+                return await fn(*args, **kwargs)
+            key = cache_key(namespace, *args, *kwargs.values())
+            try:
+                hit = await redis_client.get(key)
+            except Exception:
+                return await fn(*args, **kwargs)
+            if hit is not None:
+                return json.loads(hit)
+            result = await fn(*args, **kwargs)
+            try:
+                await redis_client.setex(key, ttl, json.dumps(result, default=_json_default))
+            except Exception:
+                pass
+            return result
+        return wrapper
+    return decorator
+
+
+COUNTER_PREFIX = "counters:v1"
+
+
+def counter_key(name: str) -> str:
+    return f"{COUNTER_PREFIX}:{name}"
+
+
+async def incr_counter(name: str, amount: int = 1):
+    """Bump an incremental counter (no-op without Redis)."""
+    if redis_client is None:
+        return
+    try:
+        await redis_client.incrby(counter_key(name), amount)
+    except Exception:
+        pass
+
+
+async def get_counters(*names: str):
+    """MGET counters as ints, or None if Redis is down or any counter is unset."""
+    if redis_client is None:
+        return None
+    try:
+        vals = await redis_client.mget([counter_key(n) for n in names])
+    except Exception:
+        return None
+    if any(v is None for v in vals):
+        return None
+    return [int(v) for v in vals]
+
+
+async def set_counters(mapping: dict):
+    """MSET counters to reconciled values (no-op without Redis)."""
+    if redis_client is None:
+        return
+    try:
+        await redis_client.mset({counter_key(k): v for k, v in mapping.items()})
+    except Exception:
+        pass
+
+
+async def invalidate(*namespaces: str):
+    """Drop every cached entry under the given namespaces (SCAN + UNLINK)."""
+    if redis_client is None:
+        return
+    try:
+        for ns in namespaces:
+            async for key in redis_client.scan_iter(match=f"{CACHE_PREFIX}:{ns}*"):
+                await redis_client.unlink(key)
+    except Exception:
+        pass
@@ -5,7 +5,7 @@ MongoDB helper functions ready to use in your backend code.
 Import and use these functions in your API endpoints for database operations.
 """
 
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
 from datetime import datetime, timezone
 import os
 from dotenv import load_dotenv
@@ -22,28 +22,98 @@ database_url = os.getenv("DATABASE_URL")
 database_name = os.getenv("DATABASE_NAME")
 
 if database_url and database_name:
-    _client = MongoClient(database_url)
+    # explicit pool bounds and short timeouts so bursts don't starve and
+    # outages fail fast; wire compression cuts bandwidth on big result sets
+    # (zlib is the always-available fallback when zstd/snappy aren't installed)
+    _client = AsyncIOMotorClient(
+        database_url,
+        maxPoolSize=100,
+        minPoolSize=10,
+        serverSelectionTimeoutMS=2000,
+        connectTimeoutMS=2000,
+        retryWrites=True,
+        compressors="zstd,snappy,zlib",
+    )
     db = _client[database_name]
 
+async def ensure_indexes():
+    """Create indexes matching every query shape used by the API.
+
+    Compound indexes cover the find/sort pairs so list endpoints walk the
+    index backwards instead of doing in-memory sorts; unique indexes back
+    the login lookup and the participant upsert.
+    """
+    if db is None:
+        return
+    await db.contribution.create_index([("project_id", 1), ("approved", 1), ("created_at", -1)])
+    await db.expense.create_index([("project_id", 1), ("created_at", -1)])
+    await db.project.create_index([("masjid_id", 1), ("created_at", -1)])
+    await db.project.create_index([("landing_slug", 1)], unique=True, sparse=True)
+    await db.user.create_index([("mobile", 1)], unique=True)
+    await db.participant.create_index([("project_id", 1), ("user_id", 1)], unique=True)
+    await db.masjid.create_index([("created_at", -1)])
+
+
+async def migrate_legacy_fks():
+    """One-off backfill: convert string foreign keys to native ObjectIds.
+
+    Documents written before the FK migration store ids as hex strings,
+    which the ObjectId-typed query predicates no longer match. Safe to run
+    on every startup; each pass only touches documents where the field is
+    still a (valid hex) string.
+    """
+    if db is None:
+        return
+    fk_fields = {
+        "masjid": ["created_by_user_id"],
+        "project": ["masjid_id"],
+        "participant": ["project_id", "user_id"],
+        "contribution": ["project_id", "user_id"],
+        "expense": ["masjid_id", "project_id", "added_by_user_id"],
+    }
+    for collection_name, fields in fk_fields.items():
+        for field in fields:
+            await db[collection_name].update_many(
+                {field: {"$type": "string", "$regex": "^[0-9a-fA-F]{24}$"}},
+                [{"$set": {field: {"$toObjectId": f"${field}"}}}],
+            )
+
+
 # Helper functions for common database operations
-def create_document(collection_name: str, data: Union[BaseModel, dict]):
+async def create_document(collection_name: str, data: Union[BaseModel, dict]):
     """Insert a single document with timestamp"""
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
 
-    # Convert Pydantic model to dict if needed
+    # Convert Pydantic model to dict if needed; drop None fields to keep BSON small
     if isinstance(data, BaseModel):
-        data_dict = data.model_dump()
+        data_dict = data.model_dump(exclude_none=True)
     else:
         data_dict = data.copy()
 
     data_dict['created_at'] = datetime.now(timezone.utc)
     data_dict['updated_at'] = datetime.now(timezone.utc)
 
-    result = db[collection_name].insert_one(data_dict)
+    result = await db[collection_name].insert_one(data_dict)
     return str(result.inserted_id)
 
-def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None):
+async def create_documents(collection_name: str, docs: list):
+    """Insert many documents in one unordered batch with timestamps"""
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    now = datetime.now(timezone.utc)
+    payload = []
+    for data in docs:
+        data_dict = data.model_dump(exclude_none=True) if isinstance(data, BaseModel) else data.copy()
+        data_dict['created_at'] = now
+        data_dict['updated_at'] = now
+        payload.append(data_dict)
+
+    result = await db[collection_name].insert_many(payload, ordered=False)
+    return [str(i) for i in result.inserted_ids]
+
+async def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None):
     """Get documents from collection"""
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
@@ -51,5 +121,5 @@ def get_documents(collection_name: str, filter_dict: dict = None, limit: int = N
     cursor = db[collection_name].find(filter_dict or {})
     if limit:
         cursor = cursor.limit(limit)
-    
-    return list(cursor)
+
+    return await cursor.to_list(length=limit)
@@ -1,15 +1,33 @@
+import asyncio
+import hmac
+import logging
 import os
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Optional, List, Dict
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from bson import ObjectId
+from pymongo import ReturnDocument
 
-from database import db, create_document, get_documents
-from schemas import User, Masjid, Project, Participant, Contribution, Expense
+from cache import cache, get_counters, incr_counter, invalidate, set_counters
+from database import db, create_document, create_documents, ensure_indexes, get_documents, migrate_legacy_fks
+from schemas import User, Masjid, Project, Participant, Contribution, Expense, Frequency, PaymentMode
 
-app = FastAPI(title="Masjid Fund Collection API")
+logger = logging.getLogger(__name__)
+
+
+class APIResponse(ORJSONResponse):
+    """orjson response that stringifies anything it can't encode natively (ObjectId)."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=str)
+
+
+app = FastAPI(title="Masjid Fund Collection API", default_response_class=APIResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -21,9 +39,6 @@ app.add_middleware(
 
 
 # Helpers
-class Obj(BaseModel):
-    id: str
-
 def oid(id_str: str):
     try:
         return ObjectId(id_str)
@@ -35,31 +50,118 @@ def collection(name: str):
     return db[name]
 
 
+# Amounts are stored as integer paise for exact arithmetic; the API speaks rupees.
+def to_paise(amount: float) -> int:
+    return int(round(amount * 100))
+
+
+def to_rupees(paise: int) -> float:
+    return paise / 100
+
+
+def stored_paise(value) -> int:
+    # documents written before the paise migration hold float rupees
+    if isinstance(value, float):
+        return to_paise(value)
+    return int(value or 0)
+
+
+# aggregation-side equivalent of stored_paise: legacy doubles are rupees
+_AMOUNT_PAISE = {"$cond": [
+    {"$eq": [{"$type": "$amount"}, "double"]},
+    {"$round": [{"$multiply": ["$amount", 100]}, 0]},
+    "$amount",
+]}
+
+
+async def sum_amount(collection_name: str, match: dict) -> int:
+    """Sum `amount` (paise) server-side with $match + $group instead of pulling rows."""
+    res = await collection(collection_name).aggregate([
+        {"$match": match},
+        {"$group": {"_id": None, "total": {"$sum": _AMOUNT_PAISE}}},
+    ]).to_list(1)
+    return int(res[0]["total"]) if res else 0
+
+
+async def contribution_page_and_total(pid) -> tuple:
+    """Newest-first page of 50 approved contributions plus grand total, one $facet."""
+    res = await collection("contribution").aggregate([
+        {"$match": {"project_id": pid, "approved": True}},
+        {"$facet": {
+            "page": [
+                {"$sort": {"created_at": -1}},
+                {"$limit": 50},
+                {"$project": {"name": 1, "mobile": 1, "amount": 1, "paid_at": 1, "created_at": 1}},
+            ],
+            "total": [{"$group": {"_id": None, "s": {"$sum": _AMOUNT_PAISE}}}],
+        }},
+    ]).to_list(1)
+    facets = res[0] if res else {"page": [], "total": []}
+    total = int(facets["total"][0]["s"]) if facets["total"] else 0
+    return facets["page"], total
+
+
+async def seed_project_denorm():
+    """One-off backfill: seed total_paise/recent_contribs on projects that
+    predate the denormalized landing-page fields, so the incremental
+    $inc/$push updates don't start the totals from zero."""
+    if db is None:
+        return
+    async for p in collection("project").find({"total_paise": {"$exists": False}}, {"_id": 1}):
+        page, total = await contribution_page_and_total(p["_id"])
+        entries = [
+            {"name": c.get("name") or c.get("mobile", "Guest"), "amount": stored_paise(c.get("amount", 0)), "paid_at": c.get("paid_at") or c.get("created_at")}
+            for c in page
+        ]
+        await collection("project").update_one(
+            {"_id": p["_id"], "total_paise": {"$exists": False}},
+            {"$set": {"total_paise": total, "recent_contribs": entries}},
+        )
+
+
+@app.on_event("startup")
+async def startup():
+    await migrate_legacy_fks()
+    await ensure_indexes()
+    await seed_project_denorm()
+
+
 @app.get("/")
-def root():
+async def root():
     return {"message": "Masjid Fund Collection API Running"}
 
 
+# list_collection_names() is a server-side catalog scan; cache it so
+# health-check polling only costs a cheap ping per request.
+_collections_cache = {"value": None, "expires": 0.0}
+_COLLECTIONS_TTL = 10.0
+
+
 @app.get("/test")
-def test_database():
+async def test_database():
     try:
-        collections = db.list_collection_names()
+        await db.command("ping")
+        now = time.monotonic()
+        if _collections_cache["value"] is None or now >= _collections_cache["expires"]:
+            _collections_cache["value"] = await db.list_collection_names()
+            _collections_cache["expires"] = now + _COLLECTIONS_TTL
         return {
             "backend": "✅ Running",
             "database": "✅ Connected & Working",
             "database_url": "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set",
             "database_name": db.name,
             "connection_status": "Connected",
-            "collections": collections,
+            "collections": _collections_cache["value"],
         }
-    except Exception as e:
+    except Exception:
+        logger.exception("Database health check failed")
         return {
             "backend": "✅ Running",
-            "database": f"❌ Error: {str(e)[:80]}",
+            "database": "❌ Error (see server log)",
             "database_url": "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set",
             "database_name": os.getenv("DATABASE_NAME"),
             "connection_status": "Error",
-            "collections": [],
+            "collections": None,
         }
 
 
@@ -70,15 +172,21 @@ class LoginRequest(BaseModel):
 
 
 @app.post("/auth/login")
-def login(req: LoginRequest):
-    u = collection("user").find_one({"mobile": req.mobile})
-    if not u:
-        # auto create user with default otp=mobile
-        user = User(mobile=req.mobile, otp=req.mobile)
-        uid = create_document("user", user)
-        u = collection("user").find_one({"_id": ObjectId(uid)})
+async def login(req: LoginRequest):
+    # atomic upsert: auto create user with default otp=mobile in one round trip,
+    # without the read-then-write race on concurrent first logins
+    now = datetime.now(timezone.utc)
+    defaults = User(mobile=req.mobile, otp=req.mobile).model_dump()
+    defaults.update(created_at=now, updated_at=now)
+    u = await collection("user").find_one_and_update(
+        {"mobile": req.mobile},
+        {"$setOnInsert": defaults},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
     otp = u.get("otp") or u.get("mobile")
-    if req.otp != otp:
+    # compare bytes: compare_digest raises TypeError on non-ASCII str
+    if not hmac.compare_digest(req.otp.encode(), otp.encode()):
         raise HTTPException(status_code=401, detail="Invalid OTP")
     u["id"] = str(u.pop("_id"))
     return {"user": u}
@@ -89,8 +197,8 @@ class UpdateOtpRequest(BaseModel):
 
 
 @app.post("/auth/update-otp/{user_id}")
-def update_otp(user_id: str, body: UpdateOtpRequest):
-    res = collection("user").update_one({"_id": oid(user_id)}, {"$set": {"otp": body.new_otp}})
+async def update_otp(user_id: str, body: UpdateOtpRequest):
+    res = await collection("user").update_one({"_id": oid(user_id)}, {"$set": {"otp": body.new_otp}})
     if res.matched_count == 0:
         raise HTTPException(status_code=404, detail="User not found")
     return {"ok": True}
@@ -105,26 +213,29 @@ class CreateMasjid(BaseModel):
 
 
 @app.post("/masjids")
-def create_masjid(body: CreateMasjid):
+async def create_masjid(body: CreateMasjid):
     masjid = Masjid(
         name=body.name,
         address=body.address,
-        created_by_user_id=body.owner_user_id,
+        created_by_user_id=oid(body.owner_user_id),
         support_whatsapp=body.support_whatsapp,
     )
-    mid = create_document("masjid", masjid)
+    mid = await create_document("masjid", masjid)
     # grant admin role
-    collection("user").update_one(
+    await collection("user").update_one(
         {"_id": oid(body.owner_user_id)},
         {"$set": {f"roles.{mid}": "admin"}},
     )
+    await incr_counter("masjids")
+    await invalidate("list_masjids", "super_summary")
     return {"id": mid}
 
 
 @app.get("/masjids")
-def list_masjids():
+@cache("list_masjids", ttl=60)
+async def list_masjids():
     items = []
-    for m in collection("masjid").find().sort("created_at", -1):
+    async for m in collection("masjid").find({}, {"name": 1, "address": 1, "support_whatsapp": 1, "created_at": 1}).sort("created_at", -1):
         m["id"] = str(m.pop("_id"))
         items.append(m)
     return {"items": items}
@@ -140,20 +251,24 @@ class CreateProject(BaseModel):
     gpay_url: Optional[str] = None
     gpay_upi: Optional[str] = None
     gpay_qr_image: Optional[str] = None
-    allowed_frequencies: Optional[List[str]] = None
+    allowed_frequencies: Optional[List[Frequency]] = None
 
 
 @app.post("/projects")
-def create_project(body: CreateProject):
-    project = Project(**body.model_dump())
-    pid = create_document("project", project)
+async def create_project(body: CreateProject):
+    project = Project(**{**body.model_dump(), "masjid_id": oid(body.masjid_id)})
+    pid = await create_document("project", project)
+    await incr_counter("projects")
+    await invalidate("list_projects", "public_project", "super_summary")
     return {"id": pid}
 
 
 @app.get("/projects/{masjid_id}")
-def list_projects(masjid_id: str):
+@cache("list_projects", ttl=30)
+async def list_projects(masjid_id: str):
     items = []
-    for p in collection("project").find({"masjid_id": masjid_id}).sort("created_at", -1):
+    # payment presentation fields (QR images etc.) are only needed on the landing page
+    async for p in collection("project").find({"masjid_id": oid(masjid_id)}, {"gpay_url": 0, "gpay_upi": 0, "gpay_qr_image": 0, "recent_contribs": 0}).sort("created_at", -1):
         p["id"] = str(p.pop("_id"))
         items.append(p)
     return {"items": items}
@@ -164,25 +279,29 @@ class JoinProject(BaseModel):
     project_id: str
     user_id: str
     pledge_amount: Optional[float] = None
-    frequency: Optional[str] = None
-    preferred_mode: Optional[str] = None
+    frequency: Optional[Frequency] = None
+    preferred_mode: Optional[PaymentMode] = None
 
 
 @app.post("/projects/join")
-def join_project(body: JoinProject):
-    # upsert participant
-    collection("participant").update_one(
-        {"project_id": body.project_id, "user_id": body.user_id},
-        {"$set": body.model_dump()},
+async def join_project(body: JoinProject):
+    # upsert participant: only $set fields the client actually sent so a
+    # repeat pledge can't clobber frequency/preferred_mode with None
+    now = datetime.now(timezone.utc)
+    data = body.model_dump(exclude_none=True, exclude={"project_id", "user_id"})
+    data["updated_at"] = now
+    await collection("participant").update_one(
+        {"project_id": oid(body.project_id), "user_id": oid(body.user_id)},
+        {"$set": data, "$setOnInsert": {"created_at": now}},
         upsert=True,
     )
     return {"ok": True}
 
 
 @app.get("/projects/{project_id}/participants")
-def list_participants(project_id: str):
+async def list_participants(project_id: str):
     items = []
-    for r in collection("participant").find({"project_id": project_id}):
+    async for r in collection("participant").find({"project_id": oid(project_id)}, {"user_id": 1, "pledge_amount": 1, "frequency": 1, "preferred_mode": 1, "created_at": 1}):
         r["id"] = str(r.pop("_id"))
         items.append(r)
     return {"items": items}
@@ -195,28 +314,104 @@ class AddContribution(BaseModel):
     mobile: Optional[str] = None
     name: Optional[str] = None
     amount: float
-    mode: str
+    mode: PaymentMode
     note: Optional[str] = None
     proof_url: Optional[str] = None
     paid_at: Optional[datetime] = None
 
 
 @app.post("/contributions")
-def add_contribution(body: AddContribution):
-    c = Contribution(**body.model_dump())
-    cid = create_document("contribution", c)
+async def add_contribution(body: AddContribution):
+    pid = oid(body.project_id)
+    c = Contribution(**{
+        **body.model_dump(),
+        "amount": to_paise(body.amount),
+        "project_id": pid,
+        "user_id": oid(body.user_id) if body.user_id else None,
+    })
+    cid = await create_document("contribution", c)
+    if c.approved:
+        await incr_counter("contrib_total_paise", c.amount)
+        # keep the project's denormalized landing-page fields current:
+        # running total plus a capped, newest-first recent list
+        entry = {
+            "name": c.name or c.mobile or "Guest",
+            "amount": c.amount,
+            "paid_at": c.paid_at or datetime.now(timezone.utc),
+        }
+        # only update seeded projects; unseeded ones keep the $facet fallback
+        await collection("project").update_one(
+            {"_id": pid, "total_paise": {"$exists": True}},
+            {
+                "$inc": {"total_paise": c.amount},
+                "$push": {"recent_contribs": {"$each": [entry], "$position": 0, "$slice": 50}},
+            },
+        )
+    await invalidate("public_project", "super_summary")
     return {"id": cid}
 
 
+MAX_BULK_CONTRIBUTIONS = 1000
+
+
+@app.post("/contributions/bulk")
+async def add_contributions_bulk(body: List[AddContribution]):
+    # one unordered insert_many instead of a round trip per row
+    if len(body) > MAX_BULK_CONTRIBUTIONS:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BULK_CONTRIBUTIONS} contributions per call")
+    if not body:
+        return {"ids": []}
+    docs = [
+        Contribution(**{
+            **b.model_dump(),
+            "amount": to_paise(b.amount),
+            "project_id": oid(b.project_id),
+            "user_id": oid(b.user_id) if b.user_id else None,
+        })
+        for b in body
+    ]
+    ids = await create_documents("contribution", docs)
+    total_paise = sum(d.amount for d in docs if d.approved)
+    if total_paise:
+        await incr_counter("contrib_total_paise", total_paise)
+        # bulk imports are historical: bump project totals but leave the
+        # newest-first recent_contribs list alone
+        per_project: Dict[ObjectId, int] = {}
+        for d in docs:
+            if d.approved:
+                per_project[d.project_id] = per_project.get(d.project_id, 0) + d.amount
+        for pid, amt in per_project.items():
+            await collection("project").update_one({"_id": pid, "total_paise": {"$exists": True}}, {"$inc": {"total_paise": amt}})
+    await invalidate("public_project", "super_summary")
+    return {"ids": ids}
+
+
 @app.get("/projects/{project_id}/contributions")
-def list_contributions(project_id: str):
+async def list_contributions(project_id: str, limit: int = Query(50, ge=1, le=200), offset: int = Query(0, ge=0)):
     items = []
-    total = 0.0
-    for r in collection("contribution").find({"project_id": project_id, "approved": True}).sort("created_at", -1):
+    pid = oid(project_id)
+    async for r in collection("contribution").find({"project_id": pid, "approved": True}, {"proof_url": 0}).sort("created_at", -1).skip(offset).limit(limit):
         r["id"] = str(r.pop("_id"))
-        total += float(r.get("amount", 0))
+        r["amount_paise"] = stored_paise(r.get("amount", 0))
+        r["amount"] = to_rupees(r["amount_paise"])
         items.append(r)
-    return {"items": items, "total": total}
+    total = await sum_amount("contribution", {"project_id": pid, "approved": True})
+    return {"items": items, "total": to_rupees(total), "total_paise": total}
+
+
+@app.get("/projects/{project_id}/contributions.ndjson")
+async def stream_contributions(project_id: str):
+    # streaming export: constant memory, first byte out before the cursor is drained
+    cursor = collection("contribution").find({"project_id": oid(project_id), "approved": True}, {"proof_url": 0}).sort("created_at", -1)
+
+    async def gen():
+        async for r in cursor:
+            r["id"] = str(r.pop("_id"))
+            r["amount_paise"] = stored_paise(r.get("amount", 0))
+            r["amount"] = to_rupees(r["amount_paise"])
+            yield orjson.dumps(r, default=str) + b"\n"
+
+    return StreamingResponse(gen(), media_type="application/x-ndjson")
 
 
 # Expenses (by accountant)
@@ -231,57 +426,100 @@ class AddExpense(BaseModel):
 
 
 @app.post("/expenses")
-def add_expense(body: AddExpense):
-    e = Expense(**body.model_dump())
-    eid = create_document("expense", e)
+async def add_expense(body: AddExpense):
+    e = Expense(**{
+        **body.model_dump(),
+        "amount": to_paise(body.amount),
+        "masjid_id": oid(body.masjid_id),
+        "project_id": oid(body.project_id),
+        "added_by_user_id": oid(body.added_by_user_id) if body.added_by_user_id else None,
+    })
+    eid = await create_document("expense", e)
+    await incr_counter("expense_total_paise", e.amount)
+    await invalidate("super_summary")
     return {"id": eid}
 
 
 @app.get("/projects/{project_id}/expenses")
-def list_expenses(project_id: str):
+async def list_expenses(project_id: str, limit: int = Query(50, ge=1, le=200), offset: int = Query(0, ge=0)):
     items = []
-    total = 0.0
-    for r in collection("expense").find({"project_id": project_id}).sort("created_at", -1):
+    pid = oid(project_id)
+    async for r in collection("expense").find({"project_id": pid}, {"attachment_url": 0}).sort("created_at", -1).skip(offset).limit(limit):
         r["id"] = str(r.pop("_id"))
-        total += float(r.get("amount", 0))
+        r["amount_paise"] = stored_paise(r.get("amount", 0))
+        r["amount"] = to_rupees(r["amount_paise"])
         items.append(r)
-    return {"items": items, "total": total}
+    total = await sum_amount("expense", {"project_id": pid})
+    return {"items": items, "total": to_rupees(total), "total_paise": total}
+
+
+@app.get("/projects/{project_id}/expenses.ndjson")
+async def stream_expenses(project_id: str):
+    cursor = collection("expense").find({"project_id": oid(project_id)}, {"attachment_url": 0}).sort("created_at", -1)
+
+    async def gen():
+        async for r in cursor:
+            r["id"] = str(r.pop("_id"))
+            r["amount_paise"] = stored_paise(r.get("amount", 0))
+            r["amount"] = to_rupees(r["amount_paise"])
+            yield orjson.dumps(r, default=str) + b"\n"
+
+    return StreamingResponse(gen(), media_type="application/x-ndjson")
 
 
 # Aggregated transparency per project
 @app.get("/projects/{project_id}/ledger")
-def project_ledger(project_id: str):
-    contrib_total = 0.0
-    expense_total = 0.0
-    for c in collection("contribution").find({"project_id": project_id, "approved": True}):
-        contrib_total += float(c.get("amount", 0))
-    for e in collection("expense").find({"project_id": project_id}):
-        expense_total += float(e.get("amount", 0))
+async def project_ledger(project_id: str):
+    pid = oid(project_id)
+    contrib_total = await sum_amount("contribution", {"project_id": pid, "approved": True})
+    expense_total = await sum_amount("expense", {"project_id": pid})
     balance = contrib_total - expense_total
     return {
-        "contributed": contrib_total,
-        "spent": expense_total,
-        "balance": balance,
+        "contributed": to_rupees(contrib_total),
+        "spent": to_rupees(expense_total),
+        "balance": to_rupees(balance),
     }
 
 
 # Public landing: show project, contributions (names/amounts), totals
 @app.get("/public/projects/{landing_slug}")
-def public_project(landing_slug: str):
-    p = collection("project").find_one({"landing_slug": landing_slug, "is_public": True})
-    if not p:
+@cache("public_project", ttl=30)
+async def public_project(landing_slug: str):
+    # project + its masjid + recent contributions + grand total, one round trip
+    res = await collection("project").aggregate([
+        {"$match": {"landing_slug": landing_slug, "is_public": True}},
+        {"$limit": 1},
+        {"$lookup": {
+            "from": "masjid",
+            "localField": "masjid_id",
+            "foreignField": "_id",
+            "pipeline": [{"$project": {"name": 1, "address": 1, "support_whatsapp": 1}}],
+            "as": "masjid",
+        }},
+        {"$unwind": {"path": "$masjid", "preserveNullAndEmptyArrays": True}},
+    ]).to_list(1)
+    if not res:
         raise HTTPException(status_code=404, detail="Project not found")
+    p = res[0]
+    pid = p["_id"]
     p["id"] = str(p.pop("_id"))
-    # last 50 contributions
-    contribs = []
-    total = 0.0
-    for c in collection("contribution").find({"project_id": p["id"], "approved": True}).sort("created_at", -1).limit(50):
-        c["id"] = str(c.pop("_id"))
-        total += float(c.get("amount", 0))
-        contribs.append({"name": c.get("name") or c.get("mobile", "Guest"), "amount": c.get("amount"), "paid_at": c.get("paid_at") or c.get("created_at")})
-    ledger = app.router.routes  # dummy to avoid lint warning
+    masjid = p.pop("masjid", None)
+    if masjid:
+        masjid["id"] = str(masjid.pop("_id"))
+    # the project doc carries a denormalized recent list + running total,
+    # maintained by add_contribution; unseeded projects fall back to a $facet scan
+    recent = p.pop("recent_contribs", None)
+    total_paise = p.pop("total_paise", None)
+    if recent is None or total_paise is None:
+        recent, total_paise = await contribution_page_and_total(pid)
+    contribs = [
+        {"name": c.get("name") or c.get("mobile", "Guest"), "amount": to_rupees(stored_paise(c.get("amount", 0))), "paid_at": c.get("paid_at") or c.get("created_at")}
+        for c in recent
+    ]
+    total = to_rupees(total_paise)
     return {
         "project": p,
+        "masjid": masjid,
         "recent_contributions": contribs,
         "total": total,
     }
@@ -289,45 +527,62 @@ def public_project(landing_slug: str):
 
 # Admin dashboards
 @app.get("/admin/{masjid_id}/summary")
-def masjid_summary(masjid_id: str):
-    # totals per masjid across projects
-    projects = list(collection("project").find({"masjid_id": masjid_id}))
-    pids = [str(p["_id"]) for p in projects]
-    contrib_total = 0.0
-    expense_total = 0.0
-    for pid in pids:
-        for c in collection("contribution").find({"project_id": pid, "approved": True}):
-            contrib_total += float(c.get("amount", 0))
-        for e in collection("expense").find({"project_id": pid}):
-            expense_total += float(e.get("amount", 0))
+async def masjid_summary(masjid_id: str):
+    # totals per masjid across projects: one query for ids, one $group per collection
+    pids = [p["_id"] async for p in collection("project").find({"masjid_id": oid(masjid_id)}, {"_id": 1})]
+    contrib_total, expense_total = await asyncio.gather(
+        sum_amount("contribution", {"project_id": {"$in": pids}, "approved": True}),
+        sum_amount("expense", {"project_id": {"$in": pids}}),
+    )
     return {
-        "projects": len(projects),
-        "contributed": contrib_total,
-        "spent": expense_total,
-        "balance": contrib_total - expense_total,
+        "projects": len(pids),
+        "contributed": to_rupees(contrib_total),
+        "spent": to_rupees(expense_total),
+        "balance": to_rupees(contrib_total - expense_total),
     }
 
 
+async def _compute_super_totals():
+    # across all masjids: all four queries are independent, run them concurrently
+    return await asyncio.gather(
+        sum_amount("contribution", {"approved": True}),
+        sum_amount("expense", {}),
+        collection("masjid").count_documents({}),
+        collection("project").count_documents({}),
+    )
+
+
+_SUPER_COUNTERS = ("contrib_total_paise", "expense_total_paise", "masjids", "projects")
+
+
 @app.get("/super/summary")
-def super_summary():
-    # across all masjids
-    contrib_total = 0.0
-    expense_total = 0.0
-    for c in collection("contribution").find({"approved": True}):
-        contrib_total += float(c.get("amount", 0))
-    for e in collection("expense").find({}):
-        expense_total += float(e.get("amount", 0))
-    masjids = collection("masjid").count_documents({})
-    projects = collection("project").count_documents({})
+@cache("super_summary", ttl=15)
+async def super_summary():
+    # served from incremental Redis counters when warm; on a cold cache
+    # recompute from MongoDB and seed the counters so later hits are O(1)
+    vals = await get_counters(*_SUPER_COUNTERS)
+    if vals is None:
+        vals = await _compute_super_totals()
+        await set_counters(dict(zip(_SUPER_COUNTERS, vals)))
+    contrib_total, expense_total, masjids, projects = vals
     return {
         "masjids": masjids,
         "projects": projects,
-        "contributed": contrib_total,
-        "spent": expense_total,
-        "balance": contrib_total - expense_total,
+        "contributed": to_rupees(contrib_total),
+        "spent": to_rupees(expense_total),
+        "balance": to_rupees(contrib_total - expense_total),
     }
 
 
+@app.post("/super/reconcile")
+async def reconcile_super_counters():
+    # recompute counters from MongoDB to correct drift (hit nightly via cron)
+    vals = await _compute_super_totals()
+    await set_counters(dict(zip(_SUPER_COUNTERS, vals)))
+    await invalidate("super_summary")
+    return {"ok": True, "counters": dict(zip(_SUPER_COUNTERS, vals))}
+
+
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
@@ -8,16 +8,48 @@ contributions (with payment proofs), and expenses logged by accountants.
 Authentication is OTP-like via mobile; default OTP is the mobile number itself
 until the user changes it. Roles: super_admin (global), admin/accountant per masjid.
 """
-from typing import Optional, List, Literal, Dict
-from pydantic import BaseModel, Field
+from enum import Enum
+from typing import Annotated, Optional, List, Literal, Dict
+from bson import ObjectId
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
 from datetime import datetime
 
-Frequency = Literal["one_time", "weekly", "monthly", "yearly"]
-PaymentMode = Literal["direct", "online", "gpay"]
+# Foreign keys are stored as native BSON ObjectIds (12 bytes, index-friendly);
+# the validator accepts the hex strings clients send.
+def _validate_object_id(v):
+    if isinstance(v, ObjectId):
+        return v
+    if not ObjectId.is_valid(v):
+        # ValueError (not bson's InvalidId) so Pydantic reports a validation error
+        raise ValueError("Invalid ObjectId")
+    return ObjectId(v)
+
+
+PyObjectId = Annotated[ObjectId, BeforeValidator(_validate_object_id)]
+
+
+class Frequency(str, Enum):
+    one_time = "one_time"
+    weekly = "weekly"
+    monthly = "monthly"
+    yearly = "yearly"
+
+
+class PaymentMode(str, Enum):
+    direct = "direct"
+    online = "online"
+    gpay = "gpay"
+
+
 Role = Literal["super_admin", "admin", "accountant", "member"]
 
 
-class User(BaseModel):
+class StoredModel(BaseModel):
+    """Base for persisted schemas: skip validation work we never rely on."""
+    model_config = ConfigDict(extra="ignore", validate_assignment=False, use_enum_values=True, arbitrary_types_allowed=True)
+
+
+class User(StoredModel):
     mobile: str = Field(..., description="Unique mobile number, also default OTP")
     name: Optional[str] = Field(None)
     otp: Optional[str] = Field(None, description="If None, defaults to mobile")
@@ -26,15 +58,15 @@ class User(BaseModel):
     is_super_admin: bool = Field(False)
 
 
-class Masjid(BaseModel):
+class Masjid(StoredModel):
     name: str
     address: Optional[str] = None
-    created_by_user_id: Optional[str] = None
+    created_by_user_id: Optional[PyObjectId] = None
     support_whatsapp: Optional[str] = Field(None, description="WhatsApp support number for OTP help")
 
 
-class Project(BaseModel):
-    masjid_id: str
+class Project(StoredModel):
+    masjid_id: PyObjectId
     title: str
     description: Optional[str] = None
     is_public: bool = Field(True)
@@ -44,23 +76,26 @@ class Project(BaseModel):
     gpay_upi: Optional[str] = None
     gpay_qr_image: Optional[str] = Field(None, description="QR image URL")
     # allowed frequencies to suggest on UI
-    allowed_frequencies: List[Frequency] = Field(default_factory=lambda: ["one_time", "weekly", "monthly", "yearly"])
+    allowed_frequencies: List[Frequency] = Field(default_factory=lambda: [f.value for f in Frequency])
+    # denormalized landing-page fields, maintained by add_contribution
+    total_paise: int = Field(0, description="Running total of approved contributions, in paise")
+    recent_contribs: List[dict] = Field(default_factory=list, description="Capped newest-first contribution entries for the landing page")
 
 
-class Participant(BaseModel):
-    project_id: str
-    user_id: str
+class Participant(StoredModel):
+    project_id: PyObjectId
+    user_id: PyObjectId
     pledge_amount: Optional[float] = Field(None, ge=0)
     frequency: Optional[Frequency] = None
     preferred_mode: Optional[PaymentMode] = None
 
 
-class Contribution(BaseModel):
-    project_id: str
-    user_id: Optional[str] = None
+class Contribution(StoredModel):
+    project_id: PyObjectId
+    user_id: Optional[PyObjectId] = None
     mobile: Optional[str] = Field(None, description="Mobile of contributor (for guest)")
     name: Optional[str] = None
-    amount: float = Field(..., gt=0)
+    amount: int = Field(..., gt=0, description="Amount in paise (integer minor units)")
     mode: PaymentMode
     paid_at: Optional[datetime] = None
     note: Optional[str] = None
@@ -68,12 +103,12 @@ class Contribution(BaseModel):
     approved: bool = Field(True, description="Visible to all; could be moderated later")
 
 
-class Expense(BaseModel):
-    masjid_id: str
-    project_id: str
-    amount: float = Field(..., gt=0)
+class Expense(StoredModel):
+    masjid_id: PyObjectId
+    project_id: PyObjectId
+    amount: int = Field(..., gt=0, description="Amount in paise (integer minor units)")
     description: str
     spent_at: Optional[datetime] = None
-    added_by_user_id: Optional[str] = None
+    added_by_user_id: Optional[PyObjectId] = None
     attachment_url: Optional[str] = None
 